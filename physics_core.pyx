@@ -0,0 +1,79 @@
+# cython: language_level=3
+# cython: boundscheck=False
+# cython: cdivision=True
+"""
+Compiled physics kernels for the Inclined Rail Physics 3D Simulation.
+
+This optional Cython extension mirrors the scalar math of the main module
+with static C double types, so no Python float objects are boxed per call.
+The main module picks it up automatically when it has been built:
+
+    python setup.py build_ext --inplace
+
+Author: Jose Mondragon
+"""
+
+from libc.math cimport sin, cos, M_PI
+
+
+cpdef (double, double, double) rail_geometry(double angle, double rail_length, double fixed_x):
+    """
+    Compute the rail's start point and incline angle for a given angle.
+
+    Typed twin of calculate_rail_geometry in the main module: same
+    trigonometry, but all intermediates stay C doubles.
+
+    Args:
+        angle: The desired incline angle in degrees
+        rail_length: Length of the rail (m)
+        fixed_x: x coordinate of the fixed (bottom) end of the rail
+
+    Returns:
+        tuple: (start_x, start_y, angle_rad) - the start point coordinates
+            (z is always 0) and the angle converted to radians
+    """
+    cdef double angle_rad = angle * M_PI / 180.0   # Convert degrees to radians
+    cdef double height    = rail_length * sin(angle_rad)  # Vertical rise of the rail
+    cdef double base      = rail_length * cos(angle_rad)  # Horizontal run of the rail
+    return fixed_x - base, height, angle_rad
+
+
+cpdef (double, double, double, double, double, double, double, double) step(
+        double speed, double s, double angle_rad, double mass, double g,
+        double mu_sa, double rho_air, double Cd_sphere, double area_cross,
+        double volume, double rho_sphere, double dt):
+    """
+    Advance the sphere's motion by one time step dt.
+
+    Typed twin of step_physics in the main module; see that docstring for
+    the physics. Returns the same tuple of doubles:
+    (speed, s, Fg_par, F_fric, F_drag, acceleration,
+     drag_loss_inc, friction_loss_inc).
+    """
+    # Buoyant force and effective gravity reduction
+    cdef double g_eff  = g * (1 - rho_air / rho_sphere)
+
+    # Gravity component along the slope and dry friction from the normal force
+    cdef double Fg_par = mass * g_eff * sin(angle_rad)
+    cdef double N      = mass * g_eff * cos(angle_rad)
+    cdef double F_fric = mu_sa * N if angle_rad < M_PI / 2 else 0.0
+
+    # Air drag opposing motion: F = ½·ρ·C·A·v². Skipped while the sphere
+    # is at rest, where drag and both loss terms are identically zero.
+    # Energy lost this time step = Force * speed * dt.
+    cdef double F_drag            = 0.0
+    cdef double drag_loss_inc     = 0.0
+    cdef double friction_loss_inc = 0.0
+    if speed > 0:
+        F_drag            = 0.5 * rho_air * Cd_sphere * area_cross * speed * speed
+        drag_loss_inc     = F_drag * speed * dt
+        friction_loss_inc = F_fric * speed * dt
+
+    # Net force, acceleration, and Euler integration
+    cdef double acceleration = (Fg_par - F_fric - F_drag) / mass
+    speed += acceleration * dt
+    if speed < 0:
+        speed = 0.0
+    s += speed * dt
+
+    return speed, s, Fg_par, F_fric, F_drag, acceleration, drag_loss_inc, friction_loss_inc
@@ -0,0 +1,17 @@
+"""
+Build script for the optional physics_core Cython extension.
+
+Usage:
+    python setup.py build_ext --inplace
+
+The simulation runs without the extension; when built, the main module
+uses the typed C kernels in physics_core.pyx for the scalar physics math.
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="physics_core",
+    ext_modules=cythonize("physics_core.pyx", language_level=3),
+)